@@ -1,85 +1,127 @@
 
 
 
+import numpy as np
 import pandas as pd
 import sqlite3
-import random
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 
 # CONFIGURATION
 
 
 DB_PATH = 'global_inequality.db'
+SCHEMA_PATH = 'schema.sql'
 
+# Single seeded generator so every run produces the same database
+RNG = np.random.default_rng(42)
 
-# LOADING COUNTRY METADATA
+# Annual indicators (GDP, trade/education) vs biennial household surveys
+ANNUAL_YEARS = np.arange(2015, 2024)
+SURVEY_YEARS = np.array([2015, 2017, 2019, 2021, 2023])
 
+# Fixed category orders (poorest income group first) so per-group
+# parameters can be gathered from plain arrays by integer code
+INCOME_GROUPS = ('Low income', 'Lower middle income', 'Upper middle income', 'High income')
+REGIONS = ('East Asia & Pacific', 'Europe & Central Asia', 'Latin America & Caribbean',
+           'Middle East & North Africa', 'North America', 'South Asia', 'Sub-Saharan Africa')
 
-def load_country_metadata(conn):
-    """Load country reference data"""
+
+# DATABASE HELPERS
+
+
+@lru_cache(maxsize=1)
+def schema_sql():
+    """Read the DDL from schema.sql once per process"""
+    with open(SCHEMA_PATH, 'r') as f:
+        return f.read()
+
+
+def write_table(conn, table, df):
+    """Bulk-insert a DataFrame into a table already defined by schema.sql"""
+    columns = ', '.join(df.columns)
+    placeholders = ', '.join('?' * len(df.columns))
+    conn.execute(f"DELETE FROM {table}")
+    conn.executemany(
+        f"INSERT INTO {table} ({columns}) VALUES ({placeholders})",
+        df.itertuples(index=False, name=None)
+    )
+
+
+# COUNTRY METADATA
+
+
+# 48 sample countries: (code, name, region, income group)
+_COUNTRIES = (
+    ('USA', 'United States', 'North America', 'High income'),
+    ('GBR', 'United Kingdom', 'Europe & Central Asia', 'High income'),
+    ('DEU', 'Germany', 'Europe & Central Asia', 'High income'),
+    ('FRA', 'France', 'Europe & Central Asia', 'High income'),
+    ('JPN', 'Japan', 'East Asia & Pacific', 'High income'),
+    ('CHN', 'China', 'East Asia & Pacific', 'Upper middle income'),
+    ('IND', 'India', 'South Asia', 'Lower middle income'),
+    ('BRA', 'Brazil', 'Latin America & Caribbean', 'Upper middle income'),
+    ('ZAF', 'South Africa', 'Sub-Saharan Africa', 'Upper middle income'),
+    ('NGA', 'Nigeria', 'Sub-Saharan Africa', 'Lower middle income'),
+    ('KEN', 'Kenya', 'Sub-Saharan Africa', 'Lower middle income'),
+    ('ETH', 'Ethiopia', 'Sub-Saharan Africa', 'Low income'),
+    ('MEX', 'Mexico', 'Latin America & Caribbean', 'Upper middle income'),
+    ('ARG', 'Argentina', 'Latin America & Caribbean', 'Upper middle income'),
+    ('CHL', 'Chile', 'Latin America & Caribbean', 'High income'),
+    ('POL', 'Poland', 'Europe & Central Asia', 'High income'),
+    ('CZE', 'Czech Republic', 'Europe & Central Asia', 'High income'),
+    ('HUN', 'Hungary', 'Europe & Central Asia', 'High income'),
+    ('RUS', 'Russia', 'Europe & Central Asia', 'Upper middle income'),
+    ('TUR', 'Turkey', 'Europe & Central Asia', 'Upper middle income'),
+    ('IDN', 'Indonesia', 'East Asia & Pacific', 'Upper middle income'),
+    ('THA', 'Thailand', 'East Asia & Pacific', 'Upper middle income'),
+    ('VNM', 'Vietnam', 'East Asia & Pacific', 'Lower middle income'),
+    ('PHL', 'Philippines', 'East Asia & Pacific', 'Lower middle income'),
+    ('EGY', 'Egypt', 'Middle East & North Africa', 'Lower middle income'),
+    ('MAR', 'Morocco', 'Middle East & North Africa', 'Lower middle income'),
+    ('GHA', 'Ghana', 'Sub-Saharan Africa', 'Lower middle income'),
+    ('TZA', 'Tanzania', 'Sub-Saharan Africa', 'Lower middle income'),
+    ('UGA', 'Uganda', 'Sub-Saharan Africa', 'Low income'),
+    ('RWA', 'Rwanda', 'Sub-Saharan Africa', 'Low income'),
+    ('SWE', 'Sweden', 'Europe & Central Asia', 'High income'),
+    ('NOR', 'Norway', 'Europe & Central Asia', 'High income'),
+    ('DNK', 'Denmark', 'Europe & Central Asia', 'High income'),
+    ('FIN', 'Finland', 'Europe & Central Asia', 'High income'),
+    ('NLD', 'Netherlands', 'Europe & Central Asia', 'High income'),
+    ('BEL', 'Belgium', 'Europe & Central Asia', 'High income'),
+    ('AUT', 'Austria', 'Europe & Central Asia', 'High income'),
+    ('CHE', 'Switzerland', 'Europe & Central Asia', 'High income'),
+    ('ITA', 'Italy', 'Europe & Central Asia', 'High income'),
+    ('ESP', 'Spain', 'Europe & Central Asia', 'High income'),
+    ('PRT', 'Portugal', 'Europe & Central Asia', 'High income'),
+    ('GRC', 'Greece', 'Europe & Central Asia', 'High income'),
+    ('CAN', 'Canada', 'North America', 'High income'),
+    ('AUS', 'Australia', 'East Asia & Pacific', 'High income'),
+    ('NZL', 'New Zealand', 'East Asia & Pacific', 'High income'),
+    ('KOR', 'South Korea', 'East Asia & Pacific', 'High income'),
+    ('SGP', 'Singapore', 'East Asia & Pacific', 'High income'),
+    ('MYS', 'Malaysia', 'East Asia & Pacific', 'Upper middle income'),
+)
+
+
+def build_country_metadata():
+    """Build country reference data"""
     print("Loading country metadata...")
-    
-    countries_data = {
-        'country_code': ['USA', 'GBR', 'DEU', 'FRA', 'JPN', 'CHN', 'IND', 'BRA', 
-                         'ZAF', 'NGA', 'KEN', 'ETH', 'MEX', 'ARG', 'CHL', 'POL',
-                         'CZE', 'HUN', 'RUS', 'TUR', 'IDN', 'THA', 'VNM', 'PHL',
-                         'EGY', 'MAR', 'GHA', 'TZA', 'UGA', 'RWA', 'SWE', 'NOR',
-                         'DNK', 'FIN', 'NLD', 'BEL', 'AUT', 'CHE', 'ITA', 'ESP',
-                         'PRT', 'GRC', 'CAN', 'AUS', 'NZL', 'KOR', 'SGP', 'MYS'],
-        'country_name': ['United States', 'United Kingdom', 'Germany', 'France', 'Japan',
-                        'China', 'India', 'Brazil', 'South Africa', 'Nigeria',
-                        'Kenya', 'Ethiopia', 'Mexico', 'Argentina', 'Chile',
-                        'Poland', 'Czech Republic', 'Hungary', 'Russia', 'Turkey',
-                        'Indonesia', 'Thailand', 'Vietnam', 'Philippines',
-                        'Egypt', 'Morocco', 'Ghana', 'Tanzania', 'Uganda', 'Rwanda',
-                        'Sweden', 'Norway', 'Denmark', 'Finland', 'Netherlands',
-                        'Belgium', 'Austria', 'Switzerland', 'Italy', 'Spain',
-                        'Portugal', 'Greece', 'Canada', 'Australia', 'New Zealand',
-                        'South Korea', 'Singapore', 'Malaysia'],
-        'region': ['North America', 'Europe & Central Asia', 'Europe & Central Asia', 
-                   'Europe & Central Asia', 'East Asia & Pacific', 'East Asia & Pacific',
-                   'South Asia', 'Latin America & Caribbean', 'Sub-Saharan Africa',
-                   'Sub-Saharan Africa', 'Sub-Saharan Africa', 'Sub-Saharan Africa',
-                   'Latin America & Caribbean', 'Latin America & Caribbean', 
-                   'Latin America & Caribbean', 'Europe & Central Asia',
-                   'Europe & Central Asia', 'Europe & Central Asia', 'Europe & Central Asia',
-                   'Europe & Central Asia', 'East Asia & Pacific', 'East Asia & Pacific',
-                   'East Asia & Pacific', 'East Asia & Pacific', 'Middle East & North Africa',
-                   'Middle East & North Africa', 'Sub-Saharan Africa', 'Sub-Saharan Africa',
-                   'Sub-Saharan Africa', 'Sub-Saharan Africa', 'Europe & Central Asia',
-                   'Europe & Central Asia', 'Europe & Central Asia', 'Europe & Central Asia',
-                   'Europe & Central Asia', 'Europe & Central Asia', 'Europe & Central Asia',
-                   'Europe & Central Asia', 'Europe & Central Asia', 'Europe & Central Asia',
-                   'Europe & Central Asia', 'Europe & Central Asia', 'North America',
-                   'East Asia & Pacific', 'East Asia & Pacific', 'East Asia & Pacific',
-                   'East Asia & Pacific', 'East Asia & Pacific'],
-        'income_group': ['High income', 'High income', 'High income', 'High income', 'High income',
-                        'Upper middle income', 'Lower middle income', 'Upper middle income',
-                        'Upper middle income', 'Lower middle income', 'Lower middle income',
-                        'Low income', 'Upper middle income', 'Upper middle income', 
-                        'High income', 'High income', 'High income', 'High income',
-                        'Upper middle income', 'Upper middle income', 'Upper middle income',
-                        'Upper middle income', 'Lower middle income', 'Lower middle income',
-                        'Lower middle income', 'Lower middle income', 'Lower middle income',
-                        'Lower middle income', 'Low income', 'Low income', 'High income',
-                        'High income', 'High income', 'High income', 'High income',
-                        'High income', 'High income', 'High income', 'High income',
-                        'High income', 'High income', 'High income', 'High income',
-                        'High income', 'High income', 'High income', 'High income',
-                        'Upper middle income']
-    }
-    
-    df = pd.DataFrame(countries_data)
+
+    df = pd.DataFrame.from_records(
+        _COUNTRIES,
+        columns=['country_code', 'country_name', 'region', 'income_group']
+    )
     df['population_2023'] = None
     
-    df.to_sql('country_metadata', conn, if_exists='replace', index=False)
-    print(f"✓ Loaded {len(df)} countries")
+    print(f"✓ Generated {len(df)} countries")
     return df
 
-# LOADING GDP DATA
+# GDP DATA
 
 
-def load_gdp_data(conn, countries):
+def build_gdp_data(axis, ig, rng):
     """Generate realistic sample GDP data"""
     print("Creating GDP data...")
     
@@ -91,52 +133,60 @@ def load_gdp_data(conn, countries):
         'Low income': (500, 2000)
     }
     
-    data = []
-    for _, country in countries.iterrows():
-        country_code = country['country_code']
-        income_group = country['income_group']
-        
-        # Starting GDP (2015)
-        min_gdp, max_gdp = gdp_ranges[income_group]
-        base_gdp = random.uniform(min_gdp, max_gdp)
-        
-        # Generate time series (2015-2023)
-        for year in range(2015, 2024):
-            # Realistic growth rates by income level
-            if income_group == 'High income':
-                growth = random.uniform(1, 3)
-            elif income_group == 'Upper middle income':
-                growth = random.uniform(3, 7)
-            elif income_group == 'Lower middle income':
-                growth = random.uniform(4, 8)
-            else:  # Low income
-                growth = random.uniform(3, 6)
-            
-            # COVID impact in 2020
-            if year == 2020:
-                growth = random.uniform(-5, -2)
-            
-            # Calculate GDP
-            years_since_base = year - 2015
-            gdp = base_gdp * ((1 + growth/100) ** years_since_base)
-            
-            data.append({
-                'country_code': country_code,
-                'year': year,
-                'gdp_per_capita_current_usd': round(gdp, 2),
-                'gdp_total_current_usd': None,
-                'gdp_growth_annual_pct': round(growth, 2)
-            })
-    
-    df = pd.DataFrame(data)
-    df.to_sql('gdp_data', conn, if_exists='replace', index=False)
-    print(f"✓ Loaded {len(df)} GDP records")
+    # Realistic growth rates by income level
+    growth_ranges = {
+        'High income': (1, 3),
+        'Upper middle income': (3, 7),
+        'Lower middle income': (4, 8),
+        'Low income': (3, 6)
+    }
+
+    country_col, year_col = axis
+    n_countries = len(ig)
+    n_years = len(ANNUAL_YEARS)
+
+    # Per-group bounds as arrays gathered by income group code
+    gdp_low, gdp_high = np.array([gdp_ranges[g] for g in INCOME_GROUPS]).T
+    growth_low, growth_high = np.array([growth_ranges[g] for g in INCOME_GROUPS]).T
 
+    # Starting GDP (2015), sampled per country from its income group range
+    base_gdp = rng.uniform(gdp_low[ig], gdp_high[ig])
 
-# LOADING INEQUALITY DATA
+    # Growth matrix: one row per country, one column per year
+    growth = rng.uniform(growth_low[ig, None], growth_high[ig, None], size=(n_countries, n_years))
 
+    # COVID impact in 2020
+    growth[:, ANNUAL_YEARS == 2020] = rng.uniform(-5, -2, size=(n_countries, 1))
 
-def load_inequality_data(conn, countries):
+    # Calculate GDP by compounding each year's growth on the previous
+    # year, reusing one buffer for the whole chain
+    gdp = growth / 100
+    gdp += 1
+    np.cumprod(gdp, axis=1, out=gdp)
+    gdp *= base_gdp[:, None]
+
+    np.round(gdp, 2, out=gdp)
+    np.round(growth, 2, out=growth)
+
+    df = pd.DataFrame({
+        'country_code': country_col,
+        'year': year_col,
+        'gdp_per_capita_current_usd': gdp.ravel(),
+        'gdp_total_current_usd': None,
+        'gdp_growth_annual_pct': growth.ravel()
+    }, copy=False)
+
+    # 2-decimal sample metrics don't need float64; halve the frame
+    df = df.astype({c: 'float32' for c in ('gdp_per_capita_current_usd',
+                    'gdp_growth_annual_pct')})
+    print(f"✓ Generated {len(df)} GDP records")
+    return df
+
+
+# INEQUALITY DATA
+
+
+def build_inequality_data(axis, region_idx, rng):
     """Generate realistic inequality data"""
     print("Creating inequality data...")
     
@@ -151,141 +201,179 @@ def load_inequality_data(conn, countries):
         'North America': (38, 42)
     }
     
-    data = []
-    years = [2015, 2017, 2019, 2021, 2023]  # Surveys every 2 years
-    
-    for _, country in countries.iterrows():
-        country_code = country['country_code']
-        region = country['region']
-        
-        min_gini, max_gini = gini_ranges[region]
-        base_gini = random.uniform(min_gini, max_gini)
-        
-        for year in years:
-            # Small variation over time
-            gini = base_gini + random.uniform(-3, 3)
-            gini = max(20, min(70, gini))  # Realistic bounds
-            
-            # Income shares
-            lowest_20 = random.uniform(4, 9)
-            highest_20 = random.uniform(40, 55)
-            palma = round(highest_20 / (lowest_20 * 2), 2)
-            
-            data.append({
-                'country_code': country_code,
-                'year': year,
-                'gini_coefficient': round(gini, 2),
-                'income_share_lowest_20pct': round(lowest_20, 2),
-                'income_share_highest_20pct': round(highest_20, 2),
-                'palma_ratio': palma
-            })
-    
-    df = pd.DataFrame(data)
-    df.to_sql('inequality_metrics', conn, if_exists='replace', index=False)
-    print(f"✓ Loaded {len(df)} inequality records")
+    country_col, year_col = axis
+    n_countries = len(region_idx)
+    n_years = len(SURVEY_YEARS)
+
+    gini_low, gini_high = np.array([gini_ranges[r] for r in REGIONS]).T
+    base_gini = rng.uniform(gini_low[region_idx], gini_high[region_idx])
+
+    # Small variation over time, clipped to realistic bounds
+    gini = rng.uniform(-3, 3, size=(n_countries, n_years))
+    gini += base_gini[:, None]
+    np.clip(gini, 20, 70, out=gini)
+
+    # Income shares
+    lowest_20 = rng.uniform(4, 9, size=(n_countries, n_years))
+    highest_20 = rng.uniform(40, 55, size=(n_countries, n_years))
+    palma = highest_20 / (lowest_20 * 2)
 
+    for values in (gini, lowest_20, highest_20, palma):
+        np.round(values, 2, out=values)
 
-# LOADING POVERTY DATA
+    df = pd.DataFrame({
+        'country_code': country_col,
+        'year': year_col,
+        'gini_coefficient': gini.ravel(),
+        'income_share_lowest_20pct': lowest_20.ravel(),
+        'income_share_highest_20pct': highest_20.ravel(),
+        'palma_ratio': palma.ravel()
+    }, copy=False)
 
+    # 2-decimal sample metrics don't need float64; halve the frame
+    df = df.astype({c: 'float32' for c in ('gini_coefficient',
+                    'income_share_lowest_20pct',
+                    'income_share_highest_20pct',
+                    'palma_ratio')})
+    print(f"✓ Generated {len(df)} inequality records")
+    return df
+
+
+# POVERTY DATA
 
-def load_poverty_data(conn, countries):
+
+def build_poverty_data(codes, ig, rng):
     """Generate poverty data (mainly for developing countries)"""
     print("Creating poverty data...")
     
-    data = []
-    years = [2015, 2017, 2019, 2021, 2023]
-    
-    for _, country in countries.iterrows():
-        country_code = country['country_code']
-        income_group = country['income_group']
-        
-        # Only low/middle income countries have significant poverty data
-        if income_group in ['Low income', 'Lower middle income', 'Upper middle income']:
-            
-            # Base poverty rates by income level
-            if income_group == 'Low income':
-                base_215 = random.uniform(40, 70)
-                base_365 = random.uniform(60, 85)
-                base_685 = random.uniform(75, 95)
-            elif income_group == 'Lower middle income':
-                base_215 = random.uniform(10, 40)
-                base_365 = random.uniform(25, 60)
-                base_685 = random.uniform(50, 80)
-            else:  # Upper middle income
-                base_215 = random.uniform(1, 15)
-                base_365 = random.uniform(5, 30)
-                base_685 = random.uniform(15, 50)
-            
-            for year in years:
-                # Declining trend over time
-                years_since_2015 = (year - 2015) / 8
-                reduction_factor = 1 - (years_since_2015 * 0.15)  # 15% reduction over period
-                
-                data.append({
-                    'country_code': country_code,
-                    'year': year,
-                    'poverty_headcount_215_pct': round(base_215 * reduction_factor, 2),
-                    'poverty_headcount_365_pct': round(base_365 * reduction_factor, 2),
-                    'poverty_headcount_685_pct': round(base_685 * reduction_factor, 2),
-                    'poverty_gap': None
-                })
-    
-    df = pd.DataFrame(data)
-    df.to_sql('poverty_indicators', conn, if_exists='replace', index=False)
-    print(f"✓ Loaded {len(df)} poverty records")
+    # Base poverty rates by income level
+    poverty_ranges = {
+        'Low income': ((40, 70), (60, 85), (75, 95)),
+        'Lower middle income': ((10, 40), (25, 60), (50, 80)),
+        'Upper middle income': ((1, 15), (5, 30), (15, 50))
+    }
+
+    n_years = len(SURVEY_YEARS)
+
+    # Only low/middle income countries have significant poverty data;
+    # they are exactly the codes below 'High income' in INCOME_GROUPS
+    developing = ig < len(poverty_ranges)
+    dev_codes = codes[developing]
+    dev_ig = ig[developing]
+    n_dev = len(dev_codes)
+
+    # (group, threshold, low/high) bounds gathered per developing country
+    bounds = np.array([poverty_ranges[g] for g in INCOME_GROUPS[:3]])
+    base = rng.uniform(bounds[dev_ig, :, 0], bounds[dev_ig, :, 1])
+
+    # Declining trend over time (15% reduction over period)
+    reduction_factor = 1 - ((SURVEY_YEARS - 2015) / 8) * 0.15
+    rates = base[:, :, None] * reduction_factor
+    np.round(rates, 2, out=rates)
+
+    df = pd.DataFrame({
+        'country_code': np.repeat(dev_codes, n_years),
+        'year': np.tile(SURVEY_YEARS, n_dev),
+        'poverty_headcount_215_pct': rates[:, 0].ravel(),
+        'poverty_headcount_365_pct': rates[:, 1].ravel(),
+        'poverty_headcount_685_pct': rates[:, 2].ravel(),
+        'poverty_gap': None
+    }, copy=False)
+
+    # 2-decimal sample metrics don't need float64; halve the frame
+    df = df.astype({c: 'float32' for c in ('poverty_headcount_215_pct',
+                    'poverty_headcount_365_pct',
+                    'poverty_headcount_685_pct')})
+    print(f"✓ Generated {len(df)} poverty records")
+    return df
 
 
-# LOADING TRADE AND EDUCATION DATA
+# TRADE AND EDUCATION DATA
 
 
-def load_trade_education(conn, countries):
+def build_trade_education(axis, ig, rng):
     """Generate trade and education data"""
     print("Creating trade and education data...")
     
-    data = []
-    for _, country in countries.iterrows():
-        country_code = country['country_code']
-        income_group = country['income_group']
-        
-        # Trade openness varies by country size and development
-        base_trade = random.uniform(40, 150)
-        
-        # Education enrollment by income level
-        if income_group == 'High income':
-            sec_enrollment = random.uniform(95, 105)
-            ter_enrollment = random.uniform(60, 90)
-            gov_edu_exp = random.uniform(4, 6)
-        elif income_group == 'Upper middle income':
-            sec_enrollment = random.uniform(75, 95)
-            ter_enrollment = random.uniform(30, 60)
-            gov_edu_exp = random.uniform(3.5, 5.5)
-        elif income_group == 'Lower middle income':
-            sec_enrollment = random.uniform(50, 80)
-            ter_enrollment = random.uniform(15, 40)
-            gov_edu_exp = random.uniform(3, 5)
-        else:  # Low income
-            sec_enrollment = random.uniform(30, 60)
-            ter_enrollment = random.uniform(5, 20)
-            gov_edu_exp = random.uniform(2, 4)
-        
-        for year in range(2015, 2024):
-            # Slight improvement in education over time
-            years_since_2015 = year - 2015
-            sec_improvement = sec_enrollment + (years_since_2015 * 0.5)
-            ter_improvement = ter_enrollment + (years_since_2015 * 0.3)
-            
-            data.append({
-                'country_code': country_code,
-                'year': year,
-                'trade_pct_gdp': round(base_trade + random.uniform(-10, 10), 2),
-                'secondary_enrollment_rate': round(min(105, sec_improvement), 2),
-                'tertiary_enrollment_rate': round(ter_improvement, 2),
-                'government_expenditure_education_pct': round(gov_edu_exp + random.uniform(-0.5, 0.5), 2)
-            })
-    
-    df = pd.DataFrame(data)
-    df.to_sql('trade_education', conn, if_exists='replace', index=False)
-    print(f"✓ Loaded {len(df)} trade/education records")
+    # Education enrollment by income level: (secondary, tertiary, gov expenditure)
+    education_ranges = {
+        'High income': ((95, 105), (60, 90), (4, 6)),
+        'Upper middle income': ((75, 95), (30, 60), (3.5, 5.5)),
+        'Lower middle income': ((50, 80), (15, 40), (3, 5)),
+        'Low income': ((30, 60), (5, 20), (2, 4))
+    }
+
+    country_col, year_col = axis
+    n_countries = len(ig)
+    n_years = len(ANNUAL_YEARS)
+
+    # Trade openness varies by country size and development
+    base_trade = rng.uniform(40, 150, size=n_countries)
+
+    # (group, indicator, low/high) bounds gathered per country
+    bounds = np.array([education_ranges[g] for g in INCOME_GROUPS])
+    base_sec, base_ter, base_gov = rng.uniform(bounds[ig, :, 0], bounds[ig, :, 1]).T
+
+    # Slight improvement in education over time
+    years_since_2015 = ANNUAL_YEARS - 2015
+    sec_improvement = base_sec[:, None] + (years_since_2015 * 0.5)
+    ter_improvement = base_ter[:, None] + (years_since_2015 * 0.3)
+
+    trade = base_trade[:, None] + rng.uniform(-10, 10, size=(n_countries, n_years))
+    gov_edu_exp = base_gov[:, None] + rng.uniform(-0.5, 0.5, size=(n_countries, n_years))
+
+    # Secondary enrollment saturates at 105% (gross rate)
+    np.clip(sec_improvement, None, 105, out=sec_improvement)
+
+    for values in (trade, sec_improvement, ter_improvement, gov_edu_exp):
+        np.round(values, 2, out=values)
+
+    df = pd.DataFrame({
+        'country_code': country_col,
+        'year': year_col,
+        'trade_pct_gdp': trade.ravel(),
+        'secondary_enrollment_rate': sec_improvement.ravel(),
+        'tertiary_enrollment_rate': ter_improvement.ravel(),
+        'government_expenditure_education_pct': gov_edu_exp.ravel()
+    }, copy=False)
+
+    # 2-decimal sample metrics don't need float64; halve the frame
+    df = df.astype({c: 'float32' for c in ('trade_pct_gdp',
+                    'secondary_enrollment_rate',
+                    'tertiary_enrollment_rate',
+                    'government_expenditure_education_pct')})
+    print(f"✓ Generated {len(df)} trade/education records")
+    return df
+
+
+# GENERATING ALL TABLES
+
+
+def generate_all(countries):
+    """Generate the four metric tables from one pass over the countries frame"""
+    codes = countries['country_code'].to_numpy()
+
+    # Integer category codes for branchless per-group parameter lookups
+    ig = countries['income_group'].map({g: i for i, g in enumerate(INCOME_GROUPS)}).to_numpy()
+    region_idx = countries['region'].map({r: i for i, r in enumerate(REGIONS)}).to_numpy()
+
+    # Flattened (country, year) axes shared by the annual and survey tables
+    annual_axis = (np.repeat(codes, len(ANNUAL_YEARS)), np.tile(ANNUAL_YEARS, len(codes)))
+    survey_axis = (np.repeat(codes, len(SURVEY_YEARS)), np.tile(SURVEY_YEARS, len(codes)))
+
+    # The four builders are independent, and NumPy releases the GIL for
+    # the bulk draws; one child generator each keeps the output
+    # deterministic regardless of thread scheduling
+    gdp_rng, inequality_rng, poverty_rng, education_rng = RNG.spawn(4)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = {
+            'gdp_data': pool.submit(build_gdp_data, annual_axis, ig, gdp_rng),
+            'inequality_metrics': pool.submit(build_inequality_data, survey_axis, region_idx, inequality_rng),
+            'poverty_indicators': pool.submit(build_poverty_data, codes, ig, poverty_rng),
+            'trade_education': pool.submit(build_trade_education, annual_axis, ig, education_rng),
+        }
+        return {table: future.result() for table, future in futures.items()}
 
 
 # MAIN EXECUTION
@@ -299,32 +387,46 @@ def main():
     
     # Connect to database
     conn = sqlite3.connect(DB_PATH)
-    
+
+    # Bulk-load tuning: the data is regenerable sample data, so trading
+    # crash durability for speed is fine here
+    conn.executescript(
+        "PRAGMA journal_mode=WAL;"
+        "PRAGMA synchronous=OFF;"
+        "PRAGMA temp_store=MEMORY;"
+        "PRAGMA cache_size=-200000;"
+        "PRAGMA locking_mode=EXCLUSIVE;"
+    )
+
     try:
         # Execute schema
         print("Creating database schema...")
-        with open('schema.sql', 'r') as f:
-            conn.executescript(f.read())
+        conn.executescript(schema_sql())
         print("✓ Schema created\n")
         
-        # Load all data
-        countries = load_country_metadata(conn)
-        load_gdp_data(conn, countries)
-        load_inequality_data(conn, countries)
-        load_poverty_data(conn, countries)
-        load_trade_education(conn, countries)
-        
+        # Generate every table up front...
+        countries = build_country_metadata()
+        frames = {'country_metadata': countries, **generate_all(countries)}
+
+        # ...then write them all in a single transaction (one fsync
+        # instead of one per table)
+        conn.execute("BEGIN")
+        try:
+            for table, df in frames.items():
+                write_table(conn, table, df)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
         # Verify data
         print("\n" + "="*70)
         print("DATA LOADING SUMMARY")
         print("="*70)
         
-        tables = ['country_metadata', 'gdp_data', 'inequality_metrics', 
-                 'poverty_indicators', 'trade_education']
-        
-        for table in tables:
-            count = pd.read_sql(f"SELECT COUNT(*) as cnt FROM {table}", conn)
-            print(f"{table:25s}: {count['cnt'][0]:,} rows")
+        for table in frames:
+            count = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            print(f"{table:25s}: {count:,} rows")
         
         print("\n✓ Database successfully created: " + DB_PATH)
         print("\n" + "="*70)